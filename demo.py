@@ -26,6 +26,9 @@ import os
 import logging
 import argparse
 import json
+import functools
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent to path if running as script
@@ -35,11 +38,60 @@ if __name__ == '__main__':
 import edi_parser
 
 
+# Used for exact data sizes; default separators to match _estimate_json_size
+_SIZE_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def _element(elements, index):
+    """Decode one streamed element, or '' if the segment is shorter"""
+    if index < len(elements):
+        return bytes(elements[index]).decode('utf-8', 'replace')
+    return ''
+
+
+def _numeric(value):
+    """Show a numeric element the way the parser stores it ('000000905' -> '905')"""
+    try:
+        return '%.0F' % float(value)
+    except ValueError:
+        return value
+
+
+@functools.lru_cache(maxsize=64)
+def _pretty_category(category):
+    """Turn an error category like 'segment_structure' into 'Segment Structure'"""
+    return category.replace('_', ' ').title()
+
+
+def _estimate_json_size(obj):
+    """
+    Estimate the length of json.dumps(obj) without serializing it
+
+    Counts quotes and default separators exactly; only string escapes
+    are not accounted for.
+    """
+    if isinstance(obj, dict):
+        size = 2 + 2 * max(len(obj) - 1, 0)
+        for key, value in obj.items():
+            size += len(str(key)) + 4 + _estimate_json_size(value)
+        return size
+    if isinstance(obj, (list, tuple)):
+        return 2 + 2 * max(len(obj) - 1, 0) + sum(map(_estimate_json_size, obj))
+    if isinstance(obj, str):
+        return len(obj) + 2
+    if obj is None:
+        return 4
+    if isinstance(obj, bool):
+        return 4 if obj else 5
+    return len(str(obj))
+
+
 class DemoRunner:
     """Demo class demonstrating EDI parser functionality"""
 
     def __init__(self, verbose=False):
         """Initialize demo runner with logging configuration"""
+        self.verbose = verbose
         self.setup_logging(verbose)
         self.logger = logging.getLogger(__name__)
 
@@ -60,34 +112,44 @@ class DemoRunner:
 
     def format_error_details(self, error):
         """Format a single structured error object with rich details"""
-        lines = []
-        lines.append(f"  [{error['code']}] {error['severity'].upper()}")
-        lines.append(f"  Category: {error['category']}")
-
-        if error['location']['segment']:
+        lines = [
+            f"  [{error['code']}] {error['severity'].upper()}",
+            f"  Category: {error['category']}",
+        ]
+        append = lines.append
+
+        location = error['location']
+        segment = location['segment']
+        if segment:
+            line = location['line']
+            field = location['field']
             location_parts = []
-            if error['location']['line']:
-                location_parts.append(f"Line {error['location']['line']}")
-            if error['location']['segment']:
-                location_parts.append(f"Segment {error['location']['segment']}")
-            if error['location']['field']:
-                location_parts.append(f"Field {error['location']['field']}")
-            lines.append(f"  Location: {', '.join(location_parts)}")
+            if line:
+                location_parts.append(f"Line {line}")
+            location_parts.append(f"Segment {segment}")
+            if field:
+                location_parts.append(f"Field {field}")
+            append(f"  Location: {', '.join(location_parts)}")
 
-            if error['location']['path']:
-                lines.append(f"  Path: {error['location']['path']}")
+            path = location['path']
+            if path:
+                append(f"  Path: {path}")
 
-        lines.append(f"  Description: {error['description']}")
+        append(f"  Description: {error['description']}")
 
-        if error.get('value'):
-            lines.append(f"  Value: '{error['value']}'")
+        value = error.get('value')
+        if value:
+            append(f"  Value: '{value}'")
 
-        if error.get('expected') and error.get('actual'):
-            lines.append(f"  Expected: {error['expected']}")
-            lines.append(f"  Actual: {error['actual']}")
+        expected = error.get('expected')
+        actual = error.get('actual')
+        if expected and actual:
+            append(f"  Expected: {expected}")
+            append(f"  Actual: {actual}")
 
-        if error.get('suggestion'):
-            lines.append(f"  💡 Suggestion: {error['suggestion']}")
+        suggestion = error.get('suggestion')
+        if suggestion:
+            append(f"  💡 Suggestion: {suggestion}")
 
         return '\n'.join(lines)
 
@@ -119,22 +181,20 @@ class DemoRunner:
         else:
             self.logger.error(f"❌ File has {result['error_count']} validation error(s)")
 
-            if show_details and result['errors']:
+            # Skip formatting entirely when INFO output would be discarded
+            if show_details and result['errors'] and self.logger.isEnabledFor(logging.INFO):
                 self.logger.info("\n" + "=" * 70)
                 self.logger.info("DETAILED ERROR REPORT")
                 self.logger.info("=" * 70)
 
                 # Categorize errors
-                errors_by_category = {}
+                errors_by_category = defaultdict(list)
                 for error in result['errors']:
-                    cat = error['category']
-                    if cat not in errors_by_category:
-                        errors_by_category[cat] = []
-                    errors_by_category[cat].append(error)
+                    errors_by_category[error['category']].append(error)
 
                 # Show errors by category
                 for category, errors in sorted(errors_by_category.items()):
-                    self.logger.info(f"\n📂 {category.replace('_', ' ').title()} ({len(errors)} error(s)):")
+                    self.logger.info(f"\n📂 {_pretty_category(category)} ({len(errors)} error(s)):")
                     self.logger.info("-" * 70)
 
                     for i, error in enumerate(errors, 1):
@@ -168,7 +228,8 @@ class DemoRunner:
             editype='x12',
             messagetype=f'{transaction_type}005010',
             field_validation_mode='lenient' if lenient else 'strict',
-            continue_on_error=lenient
+            continue_on_error=lenient,
+            include_data=show_structure
         )
 
         if result['success']:
@@ -180,38 +241,34 @@ class DemoRunner:
                 self.logger.info("PARSED STRUCTURE SUMMARY")
                 self.logger.info("=" * 70)
 
-                data = result['data']
-                if 'children' in data and data['children']:
-                    isa = data['children'][0]
+                summary = self._summarize_envelope(filepath)
+                isa = summary['ISA']
+                if isa:
                     self.logger.info(f"\n📦 ISA (Interchange):")
-                    self.logger.info(f"   Sender: {isa.get('ISA06', '').strip()}")
-                    self.logger.info(f"   Receiver: {isa.get('ISA08', '').strip()}")
-                    self.logger.info(f"   Date: {isa.get('ISA09', '')}, Time: {isa.get('ISA10', '')}")
-                    self.logger.info(f"   Control #: {isa.get('ISA13', '')}")
-
-                    if '_children' in isa:
-                        gs = [c for c in isa['_children'] if c.get('BOTSID') == 'GS']
-                        if gs:
-                            self.logger.info(f"\n📋 GS (Functional Group):")
-                            self.logger.info(f"   Type: {gs[0].get('GS01', '')} Version: {gs[0].get('GS08', '')}")
-
-                            st_list = []
-                            for child in gs[0].get('_children', []):
-                                if child.get('BOTSID') == 'ST':
-                                    st_list.append(child)
-
-                            if st_list:
-                                self.logger.info(f"\n📄 ST (Transaction Set):")
-                                self.logger.info(f"   Type: {st_list[0].get('ST01', '')}")
-                                self.logger.info(f"   Control #: {st_list[0].get('ST02', '')}")
-
-                                # Count segments
-                                segment_count = len(st_list[0].get('_children', []))
-                                self.logger.info(f"   Segments: {segment_count}")
-
-                # Data size
-                data_size = len(json.dumps(result['data']))
-                self.logger.info(f"\n📊 Data Size: {data_size:,} characters")
+                    self.logger.info(f"   Sender: {_element(isa, 6).strip()}")
+                    self.logger.info(f"   Receiver: {_element(isa, 8).strip()}")
+                    self.logger.info(f"   Date: {_element(isa, 9)}, Time: {_element(isa, 10)}")
+                    self.logger.info(f"   Control #: {_numeric(_element(isa, 13))}")
+
+                    gs = summary['GS']
+                    if gs:
+                        self.logger.info(f"\n📋 GS (Functional Group):")
+                        self.logger.info(f"   Type: {_element(gs, 1)} Version: {_element(gs, 8)}")
+
+                        st = summary['ST']
+                        if st:
+                            self.logger.info(f"\n📄 ST (Transaction Set):")
+                            self.logger.info(f"   Type: {_element(st, 1)}")
+                            self.logger.info(f"   Control #: {_element(st, 2)}")
+                            self.logger.info(f"   Segments (ST..SE): {summary['segment_count']}")
+
+                # Data size - exact serialization only when debugging
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    data_size = sum(map(len, _SIZE_ENCODER.iterencode(result['data'])))
+                    self.logger.info(f"\n📊 Data Size: {data_size:,} characters")
+                else:
+                    data_size = _estimate_json_size(result['data'])
+                    self.logger.info(f"\n📊 Data Size: ~{data_size:,} characters")
 
             # Show warnings if any
             if result['errors']:
@@ -230,6 +287,41 @@ class DemoRunner:
                 self.logger.error(f"  {error}")
             return 1
 
+    def _summarize_envelope(self, filepath):
+        """
+        Collect ISA/GS/ST headers and the first transaction set's segment count
+
+        The count covers every segment from ST through SE inclusive (what SE01
+        declares), not just the segments directly under ST in the parsed tree.
+
+        Streams the raw file instead of walking the parsed tree, so no field
+        is decoded unless it is displayed.
+        """
+        summary = {'ISA': None, 'GS': None, 'ST': None, 'segment_count': 0}
+
+        try:
+            in_transaction = False
+            for segment_id, elements in edi_parser.stream_segments(filepath):
+                if in_transaction:
+                    summary['segment_count'] += 1
+                    if segment_id == 'SE':
+                        break
+                elif segment_id == 'ST' and summary['ST'] is None:
+                    summary['ST'] = elements
+                    summary['segment_count'] = 1
+                    in_transaction = True
+                elif segment_id in ('ISA', 'GS') and summary[segment_id] is None:
+                    summary[segment_id] = elements
+        except ValueError as e:
+            self.logger.debug(f"Could not stream envelope: {e}")
+
+        return summary
+
+    def _scan_test_files(self, test_dir):
+        """Return the .dat entries in test_dir sorted by name"""
+        with os.scandir(test_dir) as it:
+            return sorted((e for e in it if e.name.endswith('.dat')), key=lambda e: e.name)
+
     def list_test_files(self, transaction_type):
         """List all available test files"""
         test_dir = Path(__file__).parent / 'test_files' / transaction_type
@@ -238,7 +330,7 @@ class DemoRunner:
             self.logger.error(f"Test directory not found: {test_dir}")
             return 1
 
-        files = sorted(test_dir.glob('*.dat'))
+        files = self._scan_test_files(test_dir)
 
         if not files:
             self.logger.warning(f"No .dat files found in {test_dir}")
@@ -247,20 +339,24 @@ class DemoRunner:
         self.logger.info(f"Available {transaction_type} test files ({len(files)} total):")
         self.logger.info("=" * 70)
         for i, f in enumerate(files, 1):
-            size = f.stat().st_size
+            size = f.stat(follow_symlinks=False).st_size
             self.logger.info(f"  {i:2d}. {f.name:45s} ({size:>6,} bytes)")
 
         return 0
 
     def browse_and_select(self, transaction_type):
         """Interactive file browser"""
+        if not sys.stdin.isatty():
+            self.logger.error("browse requires an interactive terminal (stdin is not a TTY)")
+            return 1
+
         test_dir = Path(__file__).parent / 'test_files' / transaction_type
 
         if not test_dir.exists():
             self.logger.error(f"Test directory not found: {test_dir}")
             return 1
 
-        files = sorted(test_dir.glob('*.dat'))
+        files = self._scan_test_files(test_dir)
 
         if not files:
             self.logger.error(f"No .dat files found in {test_dir}")
@@ -271,7 +367,7 @@ class DemoRunner:
         print(f"{'='*70}\n")
 
         for i, f in enumerate(files, 1):
-            size = f.stat().st_size
+            size = f.stat(follow_symlinks=False).st_size
             print(f"  {i:2d}. {f.name:45s} ({size:>6,} bytes)")
 
         print(f"\n{'='*70}")
@@ -293,10 +389,10 @@ class DemoRunner:
                 action = input("Action - (v)alidate, (p)arse, or (q)uit: ").strip().lower()
 
                 if action == 'v':
-                    return self.run_validation(str(selected_file), transaction_type)
+                    return self.run_validation(selected_file.path, transaction_type)
                 elif action == 'p':
                     lenient = input("Use lenient mode? (y/n): ").strip().lower() == 'y'
-                    return self.run_parse(str(selected_file), transaction_type, lenient=lenient)
+                    return self.run_parse(selected_file.path, transaction_type, lenient=lenient)
                 else:
                     return 0
             else:
@@ -307,6 +403,12 @@ class DemoRunner:
             print("\nCancelled.")
             return 1
 
+    def _run_one(self, filepath, transaction_type, command, lenient):
+        """Run a single file as part of run_all_files"""
+        if command == 'validate':
+            return self.run_validation(filepath, transaction_type, show_details=False)
+        return self.run_parse(filepath, transaction_type, lenient, show_structure=False)
+
     def run_all_files(self, transaction_type, command, lenient=False):
         """Run validation or parsing on all test files"""
         test_dir = Path(__file__).parent / 'test_files' / transaction_type
@@ -315,7 +417,7 @@ class DemoRunner:
             self.logger.error(f"Test directory not found: {test_dir}")
             return 1
 
-        files = sorted(test_dir.glob('*.dat'))
+        files = self._scan_test_files(test_dir)
 
         if not files:
             self.logger.warning(f"No .dat files found in {test_dir}")
@@ -325,16 +427,28 @@ class DemoRunner:
         self.logger.info("=" * 70)
 
         results = []
-        for i, filepath in enumerate(files, 1):
-            self.logger.info(f"\n[{i}/{len(files)}] {filepath.name}")
-            self.logger.info("-" * 70)
-
-            if command == 'validate':
-                exit_code = self.run_validation(str(filepath), transaction_type, show_details=False)
-            else:  # parse
-                exit_code = self.run_parse(str(filepath), transaction_type, lenient, show_structure=False)
+        if self.verbose:
+            # Serial: keeps DEBUG tracing readable and in one process
+            for i, entry in enumerate(files, 1):
+                self.logger.info(f"\n[{i}/{len(files)}] {entry.name}")
+                self.logger.info("-" * 70)
+
+                exit_code = self._run_one(entry.path, transaction_type, command, lenient)
+                results.append((entry.name, exit_code == 0))
+        else:
+            jobs = [(e.path, transaction_type, command, lenient) for e in files]
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                # map() yields in submission order, so output stays per-file
+                outcomes = executor.map(_run_file_worker, jobs)
+                for i, (entry, (exit_code, records)) in enumerate(zip(files, outcomes), 1):
+                    self.logger.info(f"\n[{i}/{len(files)}] {entry.name}")
+                    self.logger.info("-" * 70)
+                    # Replay through the logger that emitted each record (demo,
+                    # edi_parser, ...), so handlers and propagation match a serial run
+                    for record in records:
+                        logging.getLogger(record.name).handle(record)
 
-            results.append((filepath.name, exit_code == 0))
+                    results.append((entry.name, exit_code == 0))
 
         # Summary
         self.logger.info("\n" + "=" * 70)
@@ -354,6 +468,54 @@ class DemoRunner:
         return 0 if failed == 0 else 1
 
 
+class _RecordCollector(logging.Handler):
+    """Logging handler that keeps records so a worker can ship them back"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        # Pre-format so the record pickles without its args/traceback objects;
+        # the traceback text survives in exc_text, which formatters print as-is
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _run_file_worker(job):
+    """
+    Process-pool entry point for run_all_files
+
+    Args:
+        job: (filepath, transaction_type, command, lenient)
+
+    Returns:
+        tuple: (exit_code, log records emitted while processing the file)
+    """
+    filepath, transaction_type, command, lenient = job
+
+    # Nothing may write to stderr from here, or it would land under whichever
+    # file the parent is replaying. Every record propagates to the root logger,
+    # so collect there and silence the library's own StreamHandler.
+    collector = _RecordCollector()
+    root = logging.getLogger()
+    root.handlers[:] = [collector]
+    root.setLevel(logging.INFO)
+    logging.getLogger('edi_parser').handlers.clear()
+
+    logger = logging.getLogger(__name__)
+    logger.handlers.clear()
+    logger.propagate = True
+
+    runner = DemoRunner(verbose=False)
+    exit_code = runner._run_one(filepath, transaction_type, command, lenient)
+    return exit_code, collector.records
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -4,8 +4,10 @@ Browser-based EDI Parser using PyScript
 Transforms EDI files into structured ontology schemas using the real edi_parser library.
 """
 import json
-from js import document, console, fetch
-from pyodide.ffi import to_js
+from collections import defaultdict
+from itertools import count, islice
+from js import document, console, fetch, JSON, Object
+from pyodide.ffi import create_proxy, to_js
 
 # Try to import the package - it should be pre-installed by PyScript
 try:
@@ -21,6 +23,17 @@ except ImportError as e:
     console.error(f"Failed to import edi_parser: {e}")
     console.log("Package should be installed via pyscript.toml")
 
+# Page elements, looked up once: each getElementById call crosses into JS.
+# The script tag sits at the end of <body>, so these all exist by now.
+_EDI_INPUT = document.getElementById('edi-input')
+_TRANSACTION_TYPE = document.getElementById('transaction-type')
+_FILE_SELECTOR = document.getElementById('file-selector')
+_TAB_VALIDATION = document.getElementById('tab-validation')
+_TAB_PARSED = document.getElementById('tab-parsed')
+_TAB_READABLE = document.getElementById('tab-readable')
+_TAB_ONTOLOGY = document.getElementById('tab-ontology')
+_DATA_TABS = {'parsed': _TAB_PARSED, 'readable': _TAB_READABLE, 'ontology': _TAB_ONTOLOGY}
+
 # Sample EDI data - Real 837P that parses correctly
 SAMPLE_837 = """ISA*00*          *00*          *ZZ*123456789012345*ZZ*123456789012346*061015*1705*>*00501*000010216*0*T*:~
 GS*HC*1234567890*9876543210*20061015*1705*20213*X*005010X222A1~
@@ -99,35 +112,116 @@ def parse_edi():
     """Parse EDI with validation and transform to structured ontology"""
     try:
         # Get input
-        edi_input = document.getElementById('edi-input').value.strip()
-        transaction_type = document.getElementById('transaction-type').value
+        edi_input = _EDI_INPUT.value.strip()
+        transaction_type = _TRANSACTION_TYPE.value
 
         if not edi_input:
-            document.getElementById('tab-validation').innerHTML = '<article class="error"><p>Please paste EDI content first</p></article>'
+            _TAB_VALIDATION.innerHTML = '<article class="error"><p>Please paste EDI content first</p></article>'
             return
 
         # Show loading
-        document.getElementById('tab-validation').innerHTML = '<article><p>Validating and parsing EDI...</p></article>'
+        _TAB_VALIDATION.innerHTML = '<article><p>Validating and parsing EDI...</p></article>'
 
-        # Determine messagetype from content
-        messagetype = f'{transaction_type}005010'
+        validation_result, parse_result = run_pipeline(edi_input, transaction_type)
 
-        console.log(f"Step 1: Validating with messagetype {messagetype}...")
+        # Display validation results
+        display_validation(validation_result, parse_result)
 
-        # First run validation to get structured errors (lenient mode - warnings don't fail)
-        validation_result = validate_edi_content(
-            content=edi_input.encode('utf-8'),
-            editype='x12',
-            messagetype=messagetype,
-            charset='utf-8',
-            validation_mode='lenient'  # Allow warnings to pass
-        )
+        # If parse succeeded, also show transformed data
+        if parse_result.get('success') and parse_result.get('data'):
+            display_data_tabs(parse_result['data'])
+        else:
+            # Clear data tabs if parse failed
+            _pending_tabs.clear()
+            _tree_nodes.clear()
+            _TAB_PARSED.innerHTML = '<article><p>Parse failed - no data extracted</p></article>'
+            _TAB_READABLE.replaceChildren()
+            _TAB_ONTOLOGY.replaceChildren()
 
+    except Exception as e:
+        console.error(f"Error: {e}")
+        import traceback
+        # Innermost frames only; that is where the parser raised
+        tb = traceback.format_exc(limit=-5)
+        console.error(tb)
+        _TAB_VALIDATION.replaceChildren(_error_article(str(e), tb))
+
+
+def _error_article(message, details):
+    """Error card built from text nodes, so message and traceback are shown verbatim"""
+    article = document.createElement('article')
+    article.className = 'error'
+    header = document.createElement('header')
+    strong = document.createElement('strong')
+    strong.textContent = 'Error'
+    header.appendChild(strong)
+    paragraph = document.createElement('p')
+    paragraph.textContent = message
+    pre = document.createElement('pre')
+    pre.textContent = details
+    article.append(header, paragraph, pre)
+    return article
+
+
+# Take the parsed tree from the validation pass instead of parsing twice.
+# Off by default: validation recovers from errors differently from the lenient
+# parse, so for some files it shows a partial tree where the parse reports
+# failure.
+SINGLE_PASS = False
+
+# Results of the last run. 'key' is (transaction_type, edi_input); 'readable'
+# and 'ontology' are added the first time their tab is shown.
+_last_run = {}
+
+
+def run_pipeline(edi_input, transaction_type):
+    """
+    Validate and parse EDI input
+
+    Re-clicking Transform on unchanged input reuses the previous results.
+    Naming and the ontology transform are left to get_readable() and
+    get_ontology(), so they only run if those tabs are opened.
+
+    Returns:
+        tuple: (validation_result, parse_result)
+    """
+    key = (transaction_type, edi_input)
+    if _last_run.get('key') == key:
+        console.log("Input unchanged - reusing previous results")
+        return _last_run['validation'], _last_run['parse']
+
+    # Determine messagetype from content
+    messagetype = f'{transaction_type}005010'
+    content = edi_input.encode('utf-8')
+
+    console.log(f"Step 1: Validating with messagetype {messagetype}...")
+
+    # First run validation to get structured errors (lenient mode - warnings don't fail)
+    validation_result = validate_edi_content(
+        content=content,
+        editype='x12',
+        messagetype=messagetype,
+        charset='utf-8',
+        validation_mode='lenient',  # Allow warnings to pass
+        include_data=SINGLE_PASS
+    )
+
+    # Releases without include_data return no 'data' key: parse separately
+    if SINGLE_PASS and 'data' in validation_result:
+        # Reuse the tree recovered by the validation pass
+        data = validation_result.get('data')
+        parse_result = {
+            'success': data is not None,
+            'data': data,
+            'errors': [e.get('message') or e.get('description') for e in validation_result['errors']
+                       if e.get('severity') in ('critical', 'error')],
+        }
+    else:
         console.log("Step 2: Parsing in lenient mode...")
 
         # Then parse in lenient mode to extract data regardless
         parse_result = parse_edi_content(
-            content=edi_input.encode('utf-8'),
+            content=content,
             editype='x12',
             messagetype=messagetype,
             charset='utf-8',
@@ -135,202 +229,377 @@ def parse_edi():
             continue_on_error=True
         )
 
-        # Display validation results
-        display_validation(validation_result, parse_result)
+    # Keep only the latest run; parse trees can be large
+    _last_run.clear()
+    _last_run.update(key=key, validation=validation_result, parse=parse_result)
+    return validation_result, parse_result
+
+
+def get_readable():
+    """Human-readable view of the last parse, built on first use"""
+    if 'readable' not in _last_run:
+        console.log("Step 3: Adding human-readable names...")
+        _last_run['readable'] = add_human_readable_names(
+            _last_run['parse']['data'],
+            transaction=_last_run['key'][0],
+            version='5010',
+            mode='dual'
+        )
+    return _last_run['readable']
 
-        # If parse succeeded, also show transformed data
-        if parse_result.get('success') and parse_result.get('data'):
-            console.log("Step 3: Adding human-readable names...")
-            readable = add_human_readable_names(
-                parse_result['data'],
-                transaction=transaction_type,
-                version='5010',
-                mode='dual'
-            )
-
-            console.log("Step 4: Transforming to ontology...")
-            if transaction_type == '837':
-                ontology = transform_837p(readable, source_filename='browser_input.txt')
-            else:
-                ontology = transform_835(readable)
-
-            # Display data tabs
-            display_data_tabs(parse_result['data'], readable, ontology)
+
+def get_ontology():
+    """Ontology view of the last parse, built on first use"""
+    if 'ontology' not in _last_run:
+        readable = get_readable()
+
+        console.log("Step 4: Transforming to ontology...")
+        if _last_run['key'][0] == '837':
+            _last_run['ontology'] = transform_837p(readable, source_filename='browser_input.txt')
         else:
-            # Clear data tabs if parse failed
-            document.getElementById('tab-parsed').innerHTML = '<article><p>Parse failed - no data extracted</p></article>'
-            document.getElementById('tab-readable').innerHTML = ''
-            document.getElementById('tab-ontology').innerHTML = ''
+            _last_run['ontology'] = transform_835(readable)
+    return _last_run['ontology']
 
-    except Exception as e:
-        console.error(f"Error: {e}")
-        import traceback
-        console.error(traceback.format_exc())
-        document.getElementById('tab-validation').innerHTML = f'<article class="error"><header><strong>Error</strong></header><p>{str(e)}</p><pre>{traceback.format_exc()}</pre></article>'
+
+# Caps on rendered issues keep the report bounded for pathological files
+MAX_ISSUES_PER_CATEGORY = 10
+MAX_ISSUES_TOTAL = 200
+
+# Error fields carry raw EDI content; escape it before building markup
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+def _escape(value):
+    """Escape a value for interpolation into HTML text or attributes"""
+    return str(value).translate(_HTML_ESCAPE)
 
 
 def display_validation(validation_result, parse_result):
     """Display validation errors and parse status"""
-    html = ''
+    parts = []
 
     # Parse status
     if parse_result.get('success'):
-        html += '<article class="success"><header><strong>✓ Parse Successful (Lenient Mode)</strong></header>'
-        html += '<p>Data was successfully extracted from the EDI file. Check the other tabs for parsed data.</p>'
-        html += '</article>'
+        parts.append('<article class="success"><header><strong>✓ Parse Successful (Lenient Mode)</strong></header>')
+        parts.append('<p>Data was successfully extracted from the EDI file. Check the other tabs for parsed data.</p>')
+        parts.append('</article>')
     else:
-        html += '<article class="error"><header><strong>✗ Parse Failed</strong></header>'
-        html += '<p>Unable to extract data from the EDI file even in lenient mode.</p>'
+        parts.append('<article class="error"><header><strong>✗ Parse Failed</strong></header>')
+        parts.append('<p>Unable to extract data from the EDI file even in lenient mode.</p>')
         if parse_result.get('errors'):
-            html += '<ul>'
+            parts.append('<ul>')
             for err in parse_result.get('errors', [])[:5]:
-                html += f'<li>{err}</li>'
-            html += '</ul>'
-        html += '</article>'
+                parts.append(f'<li>{_escape(err)}</li>')
+            parts.append('</ul>')
+        parts.append('</article>')
 
     # Validation status
     if validation_result.get('valid'):
         # Check if there are warnings even though validation passed
         total_issues = len(validation_result.get('errors', []))
         if total_issues > 0:
-            html += f'<article class="warning"><header><strong>✓ Validation Passed (Lenient Mode)</strong></header>'
-            html += f'<p>The EDI file passed validation in lenient mode with {total_issues} warning(s). These warnings are informational and do not block processing.</p>'
-            html += '</article>'
+            parts.append(f'<article class="warning"><header><strong>✓ Validation Passed (Lenient Mode)</strong></header>')
+            parts.append(f'<p>The EDI file passed validation in lenient mode with {total_issues} warning(s). These warnings are informational and do not block processing.</p>')
+            parts.append('</article>')
         else:
-            html += '<article class="success"><header><strong>✓ Validation Passed</strong></header>'
-            html += '<p>The EDI file is valid with no errors or warnings.</p>'
-            html += '</article>'
+            parts.append('<article class="success"><header><strong>✓ Validation Passed</strong></header>')
+            parts.append('<p>The EDI file is valid with no errors or warnings.</p>')
+            parts.append('</article>')
     else:
         error_count = validation_result.get('error_count', 0)
-        html += f'<article class="error"><header><strong>✗ Found {error_count} Validation Error(s)</strong></header>'
-        html += '<p>The file has critical errors or validation issues that prevent processing.</p>'
-        html += '</article>'
+        parts.append(f'<article class="error"><header><strong>✗ Found {error_count} Validation Error(s)</strong></header>')
+        parts.append('<p>The file has critical errors or validation issues that prevent processing.</p>')
+        parts.append('</article>')
 
     # Show structured errors/warnings (for both pass and fail)
     errors = validation_result.get('errors', [])
     if errors:
         # Label changes based on validation result
         issues_label = 'Warnings' if validation_result.get('valid') else 'Validation Errors'
-        html += f'<h3>{issues_label}:</h3>'
+        parts.append(f'<h3>{issues_label}:</h3>')
 
         # Group by category
-        errors_by_category = {}
+        errors_by_category = defaultdict(list)
         for error in errors:
-            cat = error.get('category', 'unknown')
-            if cat not in errors_by_category:
-                errors_by_category[cat] = []
-            errors_by_category[cat].append(error)
+            errors_by_category[error.get('category', 'unknown')].append(error)
+
+        # Display by category, within the per-category and overall caps
+        shown = 0
+        categories = iter(sorted(errors_by_category.items()))
+        for category, cat_errors in categories:
+            parts.append(f'<h4>{category.replace("_", " ").title()} ({len(cat_errors)} issue(s))</h4>')
+
+            limit = min(MAX_ISSUES_PER_CATEGORY, MAX_ISSUES_TOTAL - shown)
+            for i, error in enumerate(islice(cat_errors, limit), 1):
+                get = error.get
+                code = get('code', 'N/A')
+                severity = get('severity', 'error').upper()
+                parts.append('<div class="validation-error">')
+                parts.append(f'<h4>Issue {i}: [{_escape(code)}] {_escape(severity)}</h4>')
+                parts.append('<dl class="error-details">')
+
+                description = get('description')
+                if description:
+                    parts.append(f'<dt>Description:</dt><dd>{_escape(description)}</dd>')
+
+                location = get('location', {})
+                loc_get = location.get
+                segment = loc_get('segment')
+                if segment:
+                    line = loc_get('line')
+                    field = loc_get('field')
+                    loc_parts = []
+                    if line:
+                        loc_parts.append(f"Line {line}")
+                    loc_parts.append(f"Segment {segment}")
+                    if field:
+                        loc_parts.append(f"Field {field}")
+                    parts.append(f'<dt>Location:</dt><dd>{_escape(", ".join(loc_parts))}</dd>')
 
-        # Display by category
-        for category, cat_errors in sorted(errors_by_category.items()):
-            html += f'<h4>{category.replace("_", " ").title()} ({len(cat_errors)} issue(s))</h4>'
+                path = loc_get('path')
+                if path:
+                    parts.append(f'<dt>Path:</dt><dd>{_escape(path)}</dd>')
 
-            for i, error in enumerate(cat_errors[:10], 1):  # Show max 10 per category
-                html += '<div class="validation-error">'
-                html += f'<h4>Issue {i}: [{error.get("code", "N/A")}] {error.get("severity", "error").upper()}</h4>'
-                html += '<dl class="error-details">'
+                value = get('value')
+                if value:
+                    parts.append(f'<dt>Value:</dt><dd>"{_escape(value)}"</dd>')
 
-                if error.get('description'):
-                    html += f'<dt>Description:</dt><dd>{error["description"]}</dd>'
+                expected = get('expected')
+                if expected:
+                    parts.append(f'<dt>Expected:</dt><dd>{_escape(expected)}</dd>')
 
-                location = error.get('location', {})
-                if location.get('segment'):
-                    loc_parts = []
-                    if location.get('line'):
-                        loc_parts.append(f"Line {location['line']}")
-                    if location.get('segment'):
-                        loc_parts.append(f"Segment {location['segment']}")
-                    if location.get('field'):
-                        loc_parts.append(f"Field {location['field']}")
-                    html += f'<dt>Location:</dt><dd>{", ".join(loc_parts)}</dd>'
+                actual = get('actual')
+                if actual:
+                    parts.append(f'<dt>Actual:</dt><dd>{_escape(actual)}</dd>')
 
-                if location.get('path'):
-                    html += f'<dt>Path:</dt><dd>{location["path"]}</dd>'
+                suggestion = get('suggestion')
+                if suggestion:
+                    parts.append(f'<dt>💡 Suggestion:</dt><dd>{_escape(suggestion)}</dd>')
 
-                if error.get('value'):
-                    html += f'<dt>Value:</dt><dd>"{error["value"]}"</dd>'
+                parts.append('</dl></div>')
 
-                if error.get('expected'):
-                    html += f'<dt>Expected:</dt><dd>{error["expected"]}</dd>'
+            if len(cat_errors) > limit:
+                parts.append(f'<p><small>... and {len(cat_errors) - limit} more {category} issues</small></p>')
 
-                if error.get('actual'):
-                    html += f'<dt>Actual:</dt><dd>{error["actual"]}</dd>'
+            shown += min(len(cat_errors), limit)
+            if shown >= MAX_ISSUES_TOTAL:
+                break
 
-                if error.get('suggestion'):
-                    html += f'<dt>💡 Suggestion:</dt><dd>{error["suggestion"]}</dd>'
+        hidden = sum(len(cat_errors) for _, cat_errors in categories)
+        if hidden:
+            parts.append(f'<p><small>... {hidden} more issue(s) in other categories not shown</small></p>')
 
-                html += '</dl></div>'
+    _TAB_VALIDATION.innerHTML = ''.join(parts)
 
-            if len(cat_errors) > 10:
-                html += f'<p><small>... and {len(cat_errors) - 10} more {category} issues</small></p>'
 
-    document.getElementById('tab-validation').innerHTML = html
+# Loaders for JSON tabs that have not been shown yet, keyed by tab name
+_pending_tabs = {}
 
+# Compact encoding takes CPython's C encoder (indent forces the pure-Python
+# one); the browser's native JSON then does the pretty-printing.
+# Non-ASCII names and addresses are kept as-is.
+_COMPACT_JSON = json.JSONEncoder(ensure_ascii=False, default=str, separators=(',', ':'))
 
-def display_data_tabs(parsed_data, readable_data, ontology):
-    """Display the three JSON outputs in the data tabs"""
-    # Create Parsed JSON view
-    parsed_html = f'<pre>{json.dumps(parsed_data, indent=2, default=str)}</pre>'
-    document.getElementById('tab-parsed').innerHTML = parsed_html
+# JSON longer than this (compact characters) is shown as a collapsible tree
+TREE_THRESHOLD = 200_000
+# Entries added to an expanded tree node per "load more" click
+TREE_PAGE_SIZE = 100
 
-    # Create Human-Readable JSON view
-    readable_html = f'<pre>{json.dumps(readable_data, indent=2, default=str)}</pre>'
-    document.getElementById('tab-readable').innerHTML = readable_html
+# Unexpanded tree state, per tab: node id (data-node) -> container value, or
+# (items, next index) for a "load more" button. The DOM only holds the ids, so
+# dropping a tab's dict frees everything that was never expanded.
+_tree_nodes = {}
+_tree_ids = count()
 
-    # Create Ontology JSON view
-    ontology_html = f'<pre>{json.dumps(ontology, indent=2, default=str)}</pre>'
-    document.getElementById('tab-ontology').innerHTML = ontology_html
+
+def display_data_tabs(parsed_data):
+    """Queue the three JSON outputs; each is built and serialized when its tab is first shown"""
+    _pending_tabs.clear()
+    _pending_tabs['parsed'] = lambda: parsed_data
+    _pending_tabs['readable'] = get_readable
+    _pending_tabs['ontology'] = get_ontology
+
+    for tab_name in _pending_tabs:
+        _tree_nodes.pop(tab_name, None)
+        _DATA_TABS[tab_name].replaceChildren()
+
+    # A data tab may already be on screen from the previous run
+    active = document.querySelector('.tab-content.active')
+    if active:
+        render_tab(active.id[len('tab-'):])
+
+
+def render_tab(tab_name):
+    """Render a queued JSON tab, if it has not been rendered yet"""
+    if tab_name not in _pending_tabs:
+        return
+
+    load = _pending_tabs.pop(tab_name)
+
+    # Plain text node: no HTML parsing, and field values cannot inject markup
+    pre = document.createElement('pre')
+    try:
+        data = load()
+    except Exception as e:
+        import traceback
+        console.error(traceback.format_exc())
+        pre.textContent = f'Error: {e}'
+        _DATA_TABS[tab_name].replaceChildren(pre)
+        return
+
+    text = _COMPACT_JSON.encode(data)
+    if len(text) > TREE_THRESHOLD and isinstance(data, (dict, list)):
+        # Too big for one text node: collapsible tree, expanded on demand
+        nodes = _tree_nodes[tab_name] = {}
+        tree = document.createElement('div')
+        tree.className = 'json-tree'
+        tree.dataset.tab = tab_name
+        # One delegated pair of listeners per tree; toggle doesn't bubble, so capture it
+        tree.addEventListener('toggle', _ON_TREE_TOGGLE, True)
+        tree.addEventListener('click', _ON_TREE_CLICK)
+        _fill_tree(tree, _tree_items(data), nodes)
+        _DATA_TABS[tab_name].replaceChildren(tree)
+    else:
+        pre.textContent = JSON.stringify(JSON.parse(text), None, 2)
+        _DATA_TABS[tab_name].replaceChildren(pre)
+
+
+def _tree_items(value):
+    """(label, child) pairs of a dict or list"""
+    return list(value.items()) if isinstance(value, dict) else list(enumerate(value))
+
+
+def _tree_node(label, value, nodes):
+    """Tree element for one value; containers build their children when first opened"""
+    if not isinstance(value, (dict, list)) or not value:
+        leaf = document.createElement('div')
+        leaf.textContent = f'{label}: {_COMPACT_JSON.encode(value)}'
+        return leaf
+
+    details = document.createElement('details')
+    summary = document.createElement('summary')
+    brackets = '{}' if isinstance(value, dict) else '[]'
+    summary.textContent = f'{label} {brackets[0]}{len(value)}{brackets[1]}'
+    details.appendChild(summary)
+
+    node_id = next(_tree_ids)
+    nodes[node_id] = value
+    details.dataset.node = str(node_id)
+    return details
+
+
+def _fill_tree(container, items, nodes, start=0):
+    """Append nodes for one page of items, and a button for the next page"""
+    end = start + TREE_PAGE_SIZE
+    for label, child in islice(items, start, end):
+        container.appendChild(_tree_node(label, child, nodes))
+
+    if end < len(items):
+        button = document.createElement('button')
+        button.className = 'outline secondary'
+        button.textContent = f'Load more ({len(items) - end} remaining)'
+
+        node_id = next(_tree_ids)
+        nodes[node_id] = (items, end)
+        button.dataset.node = str(node_id)
+        container.appendChild(button)
+
+
+def _pop_tree_node(event):
+    """Take the pending state of the tree element an event targets, if any"""
+    nodes = _tree_nodes.get(event.currentTarget.dataset.tab)
+    node_id = event.target.getAttribute('data-node')
+    if nodes is None or not node_id:
+        return None
+    return nodes.pop(int(node_id), None)
+
+
+def _on_tree_toggle(event):
+    """Fill a container node the first time it is opened"""
+    value = _pop_tree_node(event)
+    if value is not None:
+        _fill_tree(event.target, _tree_items(value), _tree_nodes[event.currentTarget.dataset.tab])
+
+
+def _on_tree_click(event):
+    """Replace a "load more" button with the next page of entries"""
+    button = event.target
+    if button.tagName != 'BUTTON':
+        return
+    page = _pop_tree_node(event)
+    if page is not None:
+        items, start = page
+        container = button.parentElement
+        button.remove()
+        _fill_tree(container, items, _tree_nodes[event.currentTarget.dataset.tab], start)
+
+
+# Created once for the page; tree roots share them, so re-rendering leaks nothing
+_ON_TREE_TOGGLE = create_proxy(_on_tree_toggle)
+_ON_TREE_CLICK = create_proxy(_on_tree_click)
+
+
+# Test file contents already fetched this session, keyed by selector value
+_file_cache = {}
 
 
 async def load_test_file():
     """Load a test file from the repository"""
     try:
-        selected = document.getElementById('file-selector').value
+        selected = _FILE_SELECTOR.value
         if not selected:
             return
 
-        # GitHub raw URL for test files
-        base_url = 'https://raw.githubusercontent.com/jaymd96/bots-edi-parser/main/test_files/'
-        file_url = base_url + selected
+        content = _file_cache.get(selected)
+        if content is None:
+            # GitHub raw URL for test files
+            base_url = 'https://raw.githubusercontent.com/jaymd96/bots-edi-parser/main/test_files/'
+            file_url = base_url + selected
+
+            console.log(f"Loading file from: {file_url}")
 
-        console.log(f"Loading file from: {file_url}")
+            # Fetch the file; let the browser's HTTP cache serve repeat visits
+            response = await fetch(file_url, to_js({'cache': 'force-cache'}, dict_converter=Object.fromEntries))
+            if not response.ok:
+                console.error(f"Failed to load file: {response.status}")
+                _EDI_INPUT.value = f"Error loading file: {response.status}"
+                return
 
-        # Fetch the file
-        response = await fetch(file_url)
-        if response.ok:
             content = await response.text()
-            document.getElementById('edi-input').value = content
+            _file_cache[selected] = content
 
-            # Set transaction type based on file
-            if selected.startswith('835'):
-                document.getElementById('transaction-type').value = '835'
-            else:
-                document.getElementById('transaction-type').value = '837'
+        _EDI_INPUT.value = content
 
-            console.log(f"Loaded {len(content)} characters")
+        # Set transaction type based on file
+        if selected.startswith('835'):
+            _TRANSACTION_TYPE.value = '835'
         else:
-            console.error(f"Failed to load file: {response.status}")
-            document.getElementById('edi-input').value = f"Error loading file: {response.status}"
+            _TRANSACTION_TYPE.value = '837'
+
+        console.log(f"Loaded {len(content)} characters")
 
     except Exception as e:
         console.error(f"Error loading file: {e}")
-        document.getElementById('edi-input').value = f"Error: {str(e)}"
+        _EDI_INPUT.value = f"Error: {str(e)}"
 
 
 def clear_all():
     """Clear all inputs and outputs"""
-    document.getElementById('edi-input').value = ''
-    document.getElementById('file-selector').value = ''
-    document.getElementById('tab-validation').innerHTML = '<article><p>Select a test file or paste your EDI content in the left panel, then click "Transform" to see validation results and structured output.</p></article>'
-    document.getElementById('tab-parsed').innerHTML = ''
-    document.getElementById('tab-readable').innerHTML = ''
-    document.getElementById('tab-ontology').innerHTML = ''
+    _EDI_INPUT.value = ''
+    _FILE_SELECTOR.value = ''
+    _pending_tabs.clear()
+    _tree_nodes.clear()
+    _last_run.clear()
+    _TAB_VALIDATION.innerHTML = '<article><p>Select a test file or paste your EDI content in the left panel, then click "Transform" to see validation results and structured output.</p></article>'
+    _TAB_PARSED.replaceChildren()
+    _TAB_READABLE.replaceChildren()
+    _TAB_ONTOLOGY.replaceChildren()
 
     # Show first tab
-    document.getElementById('tab-validation').classList.add('active')
-    document.getElementById('tab-parsed').classList.remove('active')
-    document.getElementById('tab-readable').classList.remove('active')
-    document.getElementById('tab-ontology').classList.remove('active')
+    _TAB_VALIDATION.classList.add('active')
+    _TAB_PARSED.classList.remove('active')
+    _TAB_READABLE.classList.remove('active')
+    _TAB_ONTOLOGY.classList.remove('active')
 
 
 # Make functions available to HTML onclick handlers
@@ -346,6 +615,10 @@ def on_parse_click(event):
 def on_clear_click(event):
     clear_all()
 
+@when("click", ".tab")
+def on_tab_click(event):
+    render_tab(event.target.dataset.tab)
+
 @when("click", "#load-file-btn")
 def on_load_file_click(event):
     asyncio.ensure_future(load_test_file())
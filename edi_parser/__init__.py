@@ -25,6 +25,9 @@ from .api import (
     validate_file,  # Alias
 )
 
+# Import streaming reader
+from .stream import stream_segments, Delimiters
+
 # Import transformer functions
 from .transformers import add_human_readable_names, transform_837p, transform_835
 
@@ -49,6 +52,9 @@ __all__ = [
     'parse_file',
     'validate',
     'validate_file',
+    # Streaming
+    'stream_segments',
+    'Delimiters',
     # Transformers
     'add_human_readable_names',
     'transform_837p',
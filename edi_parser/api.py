@@ -73,12 +73,14 @@ def parse_edi(
             - allow_flexible_optional_order (bool): Allow optional segments in any order (default: True)
             - checkunknownentities (bool): Validate unknown fields (default: True)
             - continue_on_error (bool): Continue parsing on non-fatal errors (default: False)
+            - include_data (bool): Convert the parsed tree into result['data'] (default: True).
+              Set to False when only success/errors are needed; 'data' is then None.
 
     Returns:
         dict: Parsed EDI as nested dictionary with the following structure:
             {
                 'success': bool,          # Whether parsing succeeded
-                'data': dict,            # Parsed EDI tree (if success=True)
+                'data': dict,            # Parsed EDI tree (if success=True and include_data)
                 'errors': list,          # List of error messages (if any)
                 'message_count': int,    # Number of messages found
                 'editype': str,         # EDI type
@@ -129,6 +131,8 @@ def parse_edi(
         'messagetype': messagetype
     }
 
+    include_data = options.get('include_data', True)
+
     ediobject = None
     try:
         # Parse the EDI file
@@ -151,7 +155,8 @@ def parse_edi(
 
         # Convert the parsed tree to dictionary
         if ediobject.root:
-            result['data'] = node_to_dict(ediobject.root)
+            if include_data:
+                result['data'] = node_to_dict(ediobject.root)
             result['message_count'] = ediobject.messagecount
             result['success'] = True
         else:
@@ -166,7 +171,8 @@ def parse_edi(
         # Try to extract partial data even on error
         if ediobject and hasattr(ediobject, 'root') and ediobject.root:
             try:
-                result['data'] = node_to_dict(ediobject.root)
+                if include_data:
+                    result['data'] = node_to_dict(ediobject.root)
                 result['message_count'] = getattr(ediobject, 'messagecount', 0)
                 result['success'] = True  # Mark as success if we got partial data
                 result['errors'].append('Note: Partial data returned due to structure validation errors with fallback grammar')
@@ -275,6 +281,9 @@ def validate_edi(
             - 'lenient': Only critical errors and errors fail, warnings are informational
         **options: Additional options:
             - debug (bool): Enable debug logging
+            - include_data (bool): Also return the parsed tree as result['data'] (default: False).
+              Saves a separate parse_edi call when both are needed; the tree is
+              whatever could be recovered while collecting errors, so it may be partial.
 
     Returns:
         dict: Validation results with structured error information:
@@ -304,7 +313,8 @@ def validate_edi(
                 ],
                 'summary': str,          # Human-readable summary
                 'editype': str,          # EDI type
-                'messagetype': str       # Message type
+                'messagetype': str,      # Message type
+                'data': dict             # Parsed EDI tree or None (only with include_data)
             }
 
     Example:
@@ -354,6 +364,10 @@ def validate_edi(
         'messagetype': messagetype
     }
 
+    include_data = options.get('include_data', False)
+    if include_data:
+        result['data'] = None
+
     ediobject = None
     try:
         # Parse the EDI file in validation mode
@@ -390,6 +404,13 @@ def validate_edi(
         else:
             result['summary'] = 'No errors found. Transaction is valid.'
 
+        # The tree is a convenience for the caller; it must not change the verdict
+        if include_data and ediobject.root:
+            try:
+                result['data'] = node_to_dict(ediobject.root)
+            except Exception as e:
+                global_config.logger.warning('Could not convert parse tree: %s', e)
+
     except Exception as e:
         # Even in validation mode, fatal errors (like file not found, grammar missing) can occur
         result['valid'] = False
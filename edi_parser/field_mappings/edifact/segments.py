@@ -6,7 +6,7 @@ Loads and provides access to EDIFACT segment definitions from JSON data files.
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 
 class SegmentDatabase:
@@ -20,6 +20,10 @@ class SegmentDatabase:
         """Initialize the database (lazy loading)"""
         self._data: Dict[str, Dict] = {}
         self._data_dir = Path(__file__).parent / 'data'
+        # Derived lookups, built on first use per version / segment
+        self._sorted_codes: Dict[str, List[str]] = {}
+        self._search_names: Dict[str, List[Tuple[str, str, str]]] = {}
+        self._field_index: Dict[Tuple[str, str, str], Dict[str, Dict]] = {}
 
     def _load_version(self, version: str) -> None:
         """Load a specific version's data if not already loaded"""
@@ -41,6 +45,23 @@ class SegmentDatabase:
         with open(filepath, 'r', encoding='utf-8') as f:
             self._data[version_key] = json.load(f)
 
+    def _fields_by(self, key: str, segment_code: str, version: str) -> Optional[Dict[str, Dict]]:
+        """Map a segment's fields by 'position' or 'code' (first match wins)"""
+        index_key = (version.upper(), segment_code.upper(), key)
+        index = self._field_index.get(index_key)
+
+        if index is None:
+            segment = self.get_segment(segment_code, version)
+            if not segment:
+                return None
+
+            index = {}
+            for field in segment.get('fields', []):
+                index.setdefault(field[key], field)
+            self._field_index[index_key] = index
+
+        return index
+
     def list_versions(self) -> List[str]:
         """List all available EDIFACT versions"""
         if not self._data_dir.exists():
@@ -101,16 +122,8 @@ class SegmentDatabase:
             >>> print(field['name'])
             'PARTY QUALIFIER'
         """
-        segment = self.get_segment(segment_code, version)
-
-        if not segment:
-            return None
-
-        for field in segment.get('fields', []):
-            if field['position'] == position:
-                return field
-
-        return None
+        fields = self._fields_by('position', segment_code, version)
+        return fields.get(position) if fields else None
 
     def list_segments(self, version: str = 'D01B') -> List[str]:
         """
@@ -131,7 +144,10 @@ class SegmentDatabase:
         self._load_version(version)
 
         version_key = version.upper()
-        return sorted(self._data[version_key]['segments'].keys())
+        if version_key not in self._sorted_codes:
+            self._sorted_codes[version_key] = sorted(self._data[version_key]['segments'])
+
+        return list(self._sorted_codes[version_key])
 
     def search_segments(
         self,
@@ -157,17 +173,21 @@ class SegmentDatabase:
         self._load_version(version)
 
         version_key = version.upper()
-        pattern_lower = name_pattern.lower()
+        names = self._search_names.get(version_key)
+        if names is None:
+            names = [
+                (code, segment['name'], segment['name'].lower())
+                for code, segment in self._data[version_key]['segments'].items()
+            ]
+            self._search_names[version_key] = names
 
-        results = []
-        for code, segment in self._data[version_key]['segments'].items():
-            if pattern_lower in segment['name'].lower():
-                results.append({
-                    'code': code,
-                    'name': segment['name']
-                })
+        pattern_lower = name_pattern.lower()
 
-        return results
+        return [
+            {'code': code, 'name': name}
+            for code, name, name_lower in names
+            if pattern_lower in name_lower
+        ]
 
     def get_field_by_code(
         self,
@@ -192,16 +212,8 @@ class SegmentDatabase:
             >>> print(field['name'])
             'PARTY QUALIFIER'
         """
-        segment = self.get_segment(segment_code, version)
-
-        if not segment:
-            return None
-
-        for field in segment.get('fields', []):
-            if field['code'] == element_code:
-                return field
-
-        return None
+        fields = self._fields_by('code', segment_code, version)
+        return fields.get(element_code) if fields else None
 
 
 # Module-level convenience functions using a shared instance
@@ -0,0 +1,123 @@
+"""
+Streaming X12 segment reader
+
+Walks an X12 file segment by segment over a read-only memory map, without
+decoding the file to str or building the parsed node tree. Useful when only
+envelope information or segment counts are needed.
+"""
+
+import mmap
+from typing import Iterator, List, NamedTuple, Tuple
+
+# ISA is a fixed-length segment: the element separator follows the tag,
+# ISA16 (sub-element separator) and the segment terminator close it.
+ISA_LENGTH = 106
+_WHITESPACE = b' \t\r\n'
+
+
+class Delimiters(NamedTuple):
+    """Separators used by an X12 interchange (all single bytes)"""
+    segment: bytes
+    element: bytes
+    subelement: bytes
+    repetition: bytes
+
+    @classmethod
+    def from_isa(cls, header: bytes) -> 'Delimiters':
+        """
+        Read the separators from a fixed-length ISA header
+
+        Args:
+            header: At least the first 106 bytes of the interchange, starting at 'ISA'
+
+        Returns:
+            Delimiters: Separators declared by the ISA segment
+
+        Raises:
+            ValueError: If the header is not a complete ISA segment
+        """
+        if len(header) < ISA_LENGTH or header[:3] != b'ISA':
+            raise ValueError('Not an X12 interchange: missing or truncated ISA segment')
+
+        return cls(
+            segment=header[105:106],
+            element=header[3:4],
+            subelement=header[104:105],
+            repetition=header[82:83],
+        )
+
+
+def stream_segments(filepath: str) -> Iterator[Tuple[str, List[memoryview]]]:
+    """
+    Iterate over the segments of an X12 file without decoding it
+
+    Args:
+        filepath: Path to an X12 file starting with an ISA segment
+
+    Yields:
+        tuple: (segment_id, elements) where segment_id is a str (e.g. 'ISA')
+            and elements is a list of memoryview slices, indexed like the
+            element positions (elements[6] is ISA06; elements[0] is the tag).
+            Call bytes(view).decode() only for the values you need.
+
+    Raises:
+        ValueError: If the file is not an X12 interchange
+
+    Note:
+        The views point into the memory map and stay valid while referenced;
+        the mapping is released once the last view is garbage collected.
+
+    Example:
+        >>> for segment_id, elements in stream_segments('payment.835'):
+        ...     if segment_id == 'ST':
+        ...         print(bytes(elements[1]).decode())
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file: mmap refuses zero-length mappings
+            raise ValueError('Not an X12 interchange: file is empty')
+
+    view = memoryview(mm)
+    try:
+        size = len(mm)
+        pos = 0
+        while pos < size and mm[pos:pos + 1] in _WHITESPACE:
+            pos += 1
+        if mm[pos:pos + 3] == b'\xef\xbb\xbf':
+            pos += 3  # UTF-8 byte order mark
+
+        delimiters = Delimiters.from_isa(mm[pos:pos + ISA_LENGTH])
+        seg_term = delimiters.segment
+        elem_sep = delimiters.element
+
+        while pos < size:
+            end = mm.find(seg_term, pos)
+            if end == -1:
+                end = size
+
+            # Skip line breaks / padding between segments
+            while pos < end and mm[pos:pos + 1] in _WHITESPACE:
+                pos += 1
+
+            if pos < end:
+                elements = []
+                start = pos
+                while True:
+                    sep = mm.find(elem_sep, start, end)
+                    if sep == -1:
+                        elements.append(view[start:end])
+                        break
+                    elements.append(view[start:sep])
+                    start = sep + 1
+
+                yield bytes(elements[0]).decode('ascii', 'replace'), elements
+
+            pos = end + 1
+    finally:
+        view.release()
+        try:
+            mm.close()
+        except BufferError:
+            pass  # Caller still holds element views; GC releases the mapping
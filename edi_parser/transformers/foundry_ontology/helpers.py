@@ -231,23 +231,25 @@ def find_segment(data: Dict[str, Any], segment_id: str, qualifier: Optional[Dict
     Returns:
         First matching segment or None
     """
-    if isinstance(data, dict):
+    # Depth-first walk with an explicit stack (no recursion limit on deep files)
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
         # Check if this is the segment
-        if data.get('BOTSID') == segment_id:
-            # Check qualifiers if provided
-            if qualifier:
-                for key, value in qualifier.items():
-                    if data.get(key) != value:
-                        return None
-            return data
-
-        # Recursively search children
-        for key in ['_children', 'children']:
-            if key in data and isinstance(data[key], list):
-                for child in data[key]:
-                    result = find_segment(child, segment_id, qualifier)
-                    if result:
-                        return result
+        if node.get('BOTSID') == segment_id:
+            # Check qualifiers if provided; a mismatch does not descend further
+            if not qualifier or all(node.get(k) == v for k, v in qualifier.items()):
+                return node
+            continue
+
+        # Push children reversed so '_children' (then 'children') pop in document order
+        for key in ('children', '_children'):
+            children = node.get(key)
+            if isinstance(children, list):
+                stack.extend(reversed(children))
 
     return None
 
@@ -4,9 +4,21 @@ Human-Readable Name Transformer
 Adds human-readable field names to parsed EDI JSON output.
 """
 
-from typing import Dict, Any, Optional
+import functools
+from typing import Dict, Any, Optional, Tuple
 from ..field_mappings.x12 import get_segment
 
+# Segment definition, field id -> element definition, node key -> resolved field name
+_SegmentEntry = Tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, Any]]
+
+# One entry per (transaction, version, segment id), built once and shared by
+# every transform in the process.
+_SEGMENTS: Dict[Tuple[str, str, str], _SegmentEntry] = {}
+
+# Field name markers: not resolved yet / key is not a field of the segment
+_UNRESOLVED = object()
+_NOT_A_FIELD = object()
+
 
 def add_human_readable_names(
     parsed_json: Dict[str, Any],
@@ -64,7 +76,7 @@ def _transform_node(
         return node
 
     # Get segment definition
-    segment_def = get_segment(segment_id, transaction, version)
+    segment_def, fields, field_names = _segment_lookup(segment_id, transaction, version)
 
     # Create transformed node
     transformed = {}
@@ -108,10 +120,18 @@ def _transform_node(
             transformed[key] = value
             continue
 
-        # Check if this is a field that needs a name
-        if segment_def and _is_field_key(key, segment_id):
-            field_name = _get_field_name(key, segment_def)
+        # Check if this is a field that needs a name (resolved once per key)
+        field_name = _NOT_A_FIELD
+        if segment_def:
+            field_name = field_names.get(key, _UNRESOLVED)
+            if field_name is _UNRESOLVED:
+                if _is_field_key(key, segment_id):
+                    field_name = _get_field_name(key, fields)
+                else:
+                    field_name = _NOT_A_FIELD
+                field_names[key] = field_name
 
+        if field_name is not _NOT_A_FIELD:
             if mode == 'dual':
                 transformed[key] = value
                 if field_name:
@@ -129,7 +149,7 @@ def _transform_node(
             else:  # metadata mode
                 transformed[key] = value
                 if field_name:
-                    elem_def = _get_element_def(key, segment_def)
+                    elem_def = _get_element_def(key, fields)
                     transformed[f'{key}_metadata'] = {
                         'name': field_name,
                         'data_element': elem_def.get('data_element', ''),
@@ -154,46 +174,55 @@ def _is_field_key(key: str, segment_id: str) -> bool:
     )
 
 
-def _get_field_name(field_id: str, segment_def: Dict[str, Any]) -> Optional[str]:
+def _segment_lookup(
+    segment_id: str,
+    transaction: str,
+    version: str
+) -> _SegmentEntry:
+    """Get (building on first use) the cached definition and lookup tables for a segment"""
+    key = (transaction, version, segment_id)
+    entry = _SEGMENTS.get(key)
+    if entry is None:
+        segment_def = get_segment(segment_id, transaction, version)
+        entry = _SEGMENTS[key] = (segment_def, _field_table(segment_def), {})
+
+    return entry
+
+
+def _field_table(segment_def: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Build the field id -> element definition table for a segment"""
+    table = {}
+    if segment_def and 'elements' in segment_def:
+        # Same order as a linear scan, so the first match wins
+        for element in segment_def['elements']:
+            table.setdefault(element.get('id'), element)
+
+            # Sub-elements of composites: BPR05.01, BPR05-01 and the raw id
+            if 'sub_elements' in element:
+                for sub in element['sub_elements']:
+                    suffix = sub.get('id', '').split('-')[-1]
+                    table.setdefault(f"{element.get('id')}.{suffix}", sub)
+                    table.setdefault(f"{element.get('id')}-{suffix}", sub)
+                    table.setdefault(sub.get('id', ''), sub)
+
+    return table
+
+
+def _get_field_name(field_id: str, fields: Dict[str, Dict[str, Any]]) -> Optional[str]:
     """Get human-readable name for a field"""
-    if not segment_def or 'elements' not in segment_def:
+    element = fields.get(field_id)
+    if element is None:
         return None
 
-    for element in segment_def['elements']:
-        if element.get('id') == field_id:
-            return element.get('name', '')
+    return element.get('name', '')
 
-        # Check sub-elements for composites
-        if 'sub_elements' in element:
-            for sub in element['sub_elements']:
-                # Handle both BPR05.01 and BPR05-01 formats
-                sub_id = f"{element.get('id')}.{sub.get('id', '').split('-')[-1]}"
-                alt_sub_id = f"{element.get('id')}-{sub.get('id', '').split('-')[-1]}"
-                if field_id in (sub_id, alt_sub_id, sub.get('id', '')):
-                    return sub.get('name', '')
 
-    return None
-
-
-def _get_element_def(field_id: str, segment_def: Dict[str, Any]) -> Dict[str, Any]:
+def _get_element_def(field_id: str, fields: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     """Get full element definition"""
-    if not segment_def or 'elements' not in segment_def:
-        return {}
-
-    for element in segment_def['elements']:
-        if element.get('id') == field_id:
-            return element
-
-        if 'sub_elements' in element:
-            for sub in element['sub_elements']:
-                sub_id = f"{element.get('id')}.{sub.get('id', '').split('-')[-1]}"
-                alt_sub_id = f"{element.get('id')}-{sub.get('id', '').split('-')[-1]}"
-                if field_id in (sub_id, alt_sub_id, sub.get('id', '')):
-                    return sub
-
-    return {}
+    return fields.get(field_id, {})
 
 
+@functools.lru_cache(maxsize=None)
 def _to_snake_case(text: str) -> str:
     """Convert text to snake_case"""
     # Remove special characters
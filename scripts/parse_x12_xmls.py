@@ -7,16 +7,59 @@ similar to the EDIFACT segment definitions.
 """
 
 import xml.etree.ElementTree as ET
+import functools
 import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Tuple
 import re
+import sys
+
+
+# Optional accelerators, imported on first use: only worker processes parse
+# XML and only the main process writes JSON, so neither pays for both.
+@functools.lru_cache(maxsize=None)
+def _lxml_etree():
+    """lxml.etree, or None when lxml is not installed"""
+    try:
+        from lxml import etree
+    except ImportError:
+        return None
+    return etree
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """orjson, or None when orjson is not installed"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+# Control and support files shipped next to the implementation guides
+_EXCLUDE_RE = re.compile(r'control|dataele|codes|maps', re.IGNORECASE)
+
+# Leading transaction number of a guide filename ("277U.4010.X070" -> "277")
+_TRANSACTION_RE = re.compile(r'\d+')
+
+# XML child tag -> output key for the plain text children of each definition
+_ELEMENT_TEXT_FIELDS = {'data_ele': 'data_element', 'name': 'name', 'usage': 'usage', 'seq': 'seq'}
+_COMPOSITE_TEXT_FIELDS = {'name': 'name', 'usage': 'usage', 'seq': 'seq'}
+_SEGMENT_TEXT_FIELDS = {'name': 'name', 'usage': 'usage', 'pos': 'position', 'max_use': 'max_use'}
+
+
+def _text(node: ET.Element) -> str:
+    """Stripped text of a node, interned (usage codes, names and seqs repeat a lot)"""
+    return sys.intern((node.text or '').strip())
 
 
 def parse_element(element_node: ET.Element) -> Dict[str, Any]:
     """Parse an element definition from XML"""
     element_data = {
-        'id': element_node.get('xid', ''),
+        'id': sys.intern(element_node.get('xid', '')),
         'data_element': '',
         'name': '',
         'usage': '',
@@ -26,16 +69,11 @@ def parse_element(element_node: ET.Element) -> Dict[str, Any]:
 
     # Extract child elements
     for child in element_node:
-        if child.tag == 'data_ele':
-            element_data['data_element'] = (child.text or '').strip()
-        elif child.tag == 'name':
-            element_data['name'] = (child.text or '').strip()
-        elif child.tag == 'usage':
-            element_data['usage'] = (child.text or '').strip()
-        elif child.tag == 'seq':
-            element_data['seq'] = (child.text or '').strip()
+        field = _ELEMENT_TEXT_FIELDS.get(child.tag)
+        if field is not None:
+            element_data[field] = _text(child)
         elif child.tag == 'valid_codes':
-            codes = [(code.text or '').strip() for code in child.findall('code') if code.text]
+            codes = [_text(code) for code in child.findall('code') if code.text]
             element_data['valid_codes'] = codes
 
     return element_data
@@ -44,7 +82,7 @@ def parse_element(element_node: ET.Element) -> Dict[str, Any]:
 def parse_composite(composite_node: ET.Element) -> Dict[str, Any]:
     """Parse a composite element definition"""
     composite_data = {
-        'id': composite_node.get('xid', ''),
+        'id': sys.intern(composite_node.get('xid', '')),
         'name': '',
         'usage': '',
         'seq': '',
@@ -52,12 +90,9 @@ def parse_composite(composite_node: ET.Element) -> Dict[str, Any]:
     }
 
     for child in composite_node:
-        if child.tag == 'name':
-            composite_data['name'] = (child.text or '').strip()
-        elif child.tag == 'usage':
-            composite_data['usage'] = (child.text or '').strip()
-        elif child.tag == 'seq':
-            composite_data['seq'] = (child.text or '').strip()
+        field = _COMPOSITE_TEXT_FIELDS.get(child.tag)
+        if field is not None:
+            composite_data[field] = _text(child)
         elif child.tag == 'element':
             sub_element = parse_element(child)
             composite_data['sub_elements'].append(sub_element)
@@ -68,7 +103,7 @@ def parse_composite(composite_node: ET.Element) -> Dict[str, Any]:
 def parse_segment(segment_node: ET.Element) -> Dict[str, Any]:
     """Parse a segment definition from XML"""
     segment_data = {
-        'id': segment_node.get('xid', ''),
+        'id': sys.intern(segment_node.get('xid', '')),
         'name': '',
         'usage': '',
         'position': '',
@@ -77,14 +112,9 @@ def parse_segment(segment_node: ET.Element) -> Dict[str, Any]:
     }
 
     for child in segment_node:
-        if child.tag == 'name':
-            segment_data['name'] = (child.text or '').strip()
-        elif child.tag == 'usage':
-            segment_data['usage'] = (child.text or '').strip()
-        elif child.tag == 'pos':
-            segment_data['position'] = (child.text or '').strip()
-        elif child.tag == 'max_use':
-            segment_data['max_use'] = (child.text or '').strip()
+        field = _SEGMENT_TEXT_FIELDS.get(child.tag)
+        if field is not None:
+            segment_data[field] = _text(child)
         elif child.tag == 'element':
             element = parse_element(child)
             segment_data['elements'].append(element)
@@ -95,42 +125,118 @@ def parse_segment(segment_node: ET.Element) -> Dict[str, Any]:
     return segment_data
 
 
+def _segment_quality(segment: Dict[str, Any]) -> Tuple[int, bool, bool]:
+    """Completeness of a segment definition: (element count, has name, has element names)"""
+    elements = segment['elements']
+    return len(elements), bool(segment['name']), bool(elements and elements[0].get('name'))
+
+
+def _is_better_segment(new: Tuple[int, bool, bool], existing: Tuple[int, bool, bool]) -> bool:
+    """
+    Check whether a duplicate segment definition should replace the stored one
+
+    Compares _segment_quality tuples: prefer more elements; when element counts
+    are equal, prefer a segment name, then element names, over definitions
+    without them.
+    """
+    new_elem_count, new_named, new_elements_named = new
+    existing_elem_count, existing_named, existing_elements_named = existing
+
+    if new_elem_count != existing_elem_count:
+        return new_elem_count > existing_elem_count
+
+    if new_named and not existing_named:
+        return True
+
+    return new_elements_named and not existing_elements_named
+
+
+def iter_segment_nodes(xml_path: Path) -> Iterator[ET.Element]:
+    """
+    Stream the segment nodes of an implementation guide XML
+
+    Each node is complete when yielded and is cleared afterwards, so only the
+    current segment subtree stays in memory. Uses lxml when installed, the
+    standard library otherwise.
+    """
+    lxml_etree = _lxml_etree()
+    if lxml_etree is not None:
+        for _, segment_node in lxml_etree.iterparse(
+            str(xml_path), events=('end',), tag='segment', huge_tree=True
+        ):
+            yield segment_node
+
+            # Drop the parsed segment and the siblings already processed
+            segment_node.clear()
+            while segment_node.getprevious() is not None:
+                del segment_node.getparent()[0]
+    else:
+        for _, node in ET.iterparse(str(xml_path), events=('end',)):
+            if node.tag == 'segment':
+                yield node
+                node.clear()
+
+
 def extract_segments_from_xml(xml_path: Path) -> Dict[str, Dict[str, Any]]:
     """Extract all segment definitions from an X12 implementation guide XML"""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-
     segments = {}
+    qualities = {}
 
-    # Recursively find all segment nodes
-    for segment_node in root.iter('segment'):
+    # Find all segment nodes, wherever they are nested
+    for segment_node in iter_segment_nodes(xml_path):
         segment_data = parse_segment(segment_node)
         segment_id = segment_data['id']
+        quality = _segment_quality(segment_data)
 
-        # Store by segment ID, merge if already exists
-        if segment_id in segments:
-            existing = segments[segment_id]
-            new_elem_count = len(segment_data['elements'])
-            existing_elem_count = len(existing['elements'])
-
-            # Prefer segments with names over those without
-            # When element counts are equal, keep the one with a name
-            if new_elem_count > existing_elem_count:
-                segments[segment_id] = segment_data
-            elif new_elem_count == existing_elem_count:
-                # If new has name and existing doesn't, use new
-                if segment_data['name'] and not existing['name']:
-                    segments[segment_id] = segment_data
-                # If new has element names and existing doesn't, use new
-                elif (segment_data['elements'] and segment_data['elements'][0].get('name')
-                      and existing['elements'] and not existing['elements'][0].get('name')):
-                    segments[segment_id] = segment_data
-        else:
+        # Store by segment ID, keep the more complete definition of duplicates
+        existing = qualities.get(segment_id)
+        if existing is None or _is_better_segment(quality, existing):
             segments[segment_id] = segment_data
+            qualities[segment_id] = quality
 
     return segments
 
 
+def process_file(xml_path: Path) -> Tuple[str, str, Dict[str, Dict[str, Any]]]:
+    """
+    Extract one implementation guide (runs in a worker process)
+
+    Returns:
+        tuple: (transaction type, version, segments by ID)
+    """
+    segments = extract_segments_from_xml(xml_path)
+
+    # Extract transaction type from filename (e.g., "835.5010.X221.A1.xml" -> "835")
+    match = _TRANSACTION_RE.match(xml_path.stem)
+    if match:
+        trans_type = match.group()
+    else:
+        trans_type = xml_path.stem
+
+    # Extract version (5010 or 4010)
+    if '5010' in xml_path.stem:
+        version = '5010'
+    elif '4010' in xml_path.stem:
+        version = '4010'
+    else:
+        version = 'unknown'
+
+    return trans_type, version, segments
+
+
+def write_json(output_file: Path, data: Dict[str, Any]) -> None:
+    """Write data as 2-space indented UTF-8 JSON (orjson when installed)"""
+    # Encode up front and write once (json.dump would issue a write per chunk)
+    orjson = _orjson()
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    with open(output_file, 'wb') as f:
+        f.write(payload)
+
+
 def main():
     """Parse all X12 XMLs and create field mapping database"""
     print("X12 Implementation Guide XML Parser")
@@ -141,104 +247,88 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Find all X12 XML files (exclude control and support files)
-    xml_files = sorted(xml_dir.glob('*.xml'))
-    exclude_patterns = ['control', 'dataele', 'codes', 'maps']
     xml_files = [
-        f for f in xml_files
-        if not any(pattern in f.stem.lower() for pattern in exclude_patterns)
+        f for f in sorted(xml_dir.glob('*.xml'))
+        if not _EXCLUDE_RE.search(f.stem)
     ]
 
     print(f"Found {len(xml_files)} X12 implementation guide files\n")
 
     # Group by transaction type and version
     by_transaction = {}
+    qualities_by_transaction = {}
+
+    # Files are independent: parse them in parallel, merge in file order
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(process_file, xml_file) for xml_file in xml_files]
+
+        # Report and merge in file order so the output is deterministic
+        for xml_file, future in zip(xml_files, futures):
+            print(f"Processing: {xml_file.name}")
+
+            try:
+                trans_type, version, segments = future.result()
 
-    for xml_file in xml_files:
-        print(f"Processing: {xml_file.name}")
-
-        try:
-            segments = extract_segments_from_xml(xml_file)
-
-            # Extract transaction type from filename (e.g., "835.5010.X221.A1.xml" -> "835")
-            match = re.match(r'(\d+)', xml_file.stem)
-            if match:
-                trans_type = match.group(1)
-            else:
-                trans_type = xml_file.stem
-
-            # Extract version (5010 or 4010)
-            if '5010' in xml_file.stem:
-                version = '5010'
-            elif '4010' in xml_file.stem:
-                version = '4010'
-            else:
-                version = 'unknown'
-
-            key = f"{trans_type}_{version}"
-
-            if key not in by_transaction:
-                by_transaction[key] = {
-                    'transaction_type': trans_type,
-                    'version': version,
-                    'filename': xml_file.name,
-                    'segments': {}
-                }
-
-            # Merge segments
-            for seg_id, seg_data in segments.items():
-                if seg_id not in by_transaction[key]['segments']:
-                    by_transaction[key]['segments'][seg_id] = seg_data
-                else:
-                    # Merge, preferring segments with names
-                    existing = by_transaction[key]['segments'][seg_id]
-                    new_elem_count = len(seg_data['elements'])
-                    existing_elem_count = len(existing['elements'])
-
-                    if new_elem_count > existing_elem_count:
-                        by_transaction[key]['segments'][seg_id] = seg_data
-                    elif new_elem_count == existing_elem_count:
-                        # Prefer segments with names
-                        if seg_data['name'] and not existing['name']:
-                            by_transaction[key]['segments'][seg_id] = seg_data
-                        elif (seg_data['elements'] and seg_data['elements'][0].get('name')
-                              and existing['elements'] and not existing['elements'][0].get('name')):
-                            by_transaction[key]['segments'][seg_id] = seg_data
-
-            print(f"  Extracted {len(segments)} segments")
-
-        except Exception as e:
-            print(f"  ERROR: {e}")
+                key = f"{trans_type}_{version}"
+
+                transaction = by_transaction.get(key)
+                if transaction is None:
+                    transaction = by_transaction[key] = {
+                        'transaction_type': trans_type,
+                        'version': version,
+                        'filename': xml_file.name,
+                        'segments': {}
+                    }
+
+                # Merge segments, preferring the more complete definitions
+                merged = transaction['segments']
+                merged_qualities = qualities_by_transaction.setdefault(key, {})
+                for seg_id, seg_data in segments.items():
+                    quality = _segment_quality(seg_data)
+                    existing = merged_qualities.get(seg_id)
+                    if existing is None or _is_better_segment(quality, existing):
+                        merged[seg_id] = seg_data
+                        merged_qualities[seg_id] = quality
+
+                print(f"  Extracted {len(segments)} segments")
+
+            except Exception as e:
+                print(f"  ERROR: {e}")
 
     # Save individual transaction files
     print(f"\n{'=' * 60}")
     print("Saving transaction-specific files...")
 
-    for key, data in by_transaction.items():
-        output_file = output_dir / f"{key}_segments.json"
+    # Independent files: overlap the disk writes, report in the usual order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        writes = []
+        for key, data in by_transaction.items():
+            output_file = output_dir / f"{key}_segments.json"
+            writes.append((key, data, output_file, executor.submit(write_json, output_file, data)))
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        for key, data, output_file, write in writes:
+            write.result()
 
-        segment_count = len(data['segments'])
-        print(f"  {key}: {segment_count} segments -> {output_file.name}")
+            segment_count = len(data['segments'])
+            print(f"  {key}: {segment_count} segments -> {output_file.name}")
 
     # Create a consolidated common segments file (segments that appear in multiple transactions)
     print(f"\n{'=' * 60}")
     print("Creating common segments database...")
 
     # Count segment occurrences
-    segment_counts = {}
+    segment_counts = Counter()
     all_segments = {}
+    best_elem_counts = {}
 
     for trans_data in by_transaction.values():
         for seg_id, seg_data in trans_data['segments'].items():
-            if seg_id not in segment_counts:
-                segment_counts[seg_id] = 0
-                all_segments[seg_id] = seg_data
             segment_counts[seg_id] += 1
 
-            # Keep most detailed version
-            if len(seg_data['elements']) > len(all_segments[seg_id]['elements']):
+            # Keep most detailed version (first one seen on ties)
+            elem_count = len(seg_data['elements'])
+            if elem_count > best_elem_counts.get(seg_id, -1):
+                best_elem_counts[seg_id] = elem_count
                 all_segments[seg_id] = seg_data
 
     # Common segments (appear in 3+ transactions)
@@ -249,11 +339,10 @@ def main():
     }
 
     common_file = output_dir / 'common_segments.json'
-    with open(common_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'description': 'Common X12 segments appearing in multiple transaction types',
-            'segments': common_segments
-        }, f, indent=2, ensure_ascii=False)
+    write_json(common_file, {
+        'description': 'Common X12 segments appearing in multiple transaction types',
+        'segments': common_segments
+    })
 
     print(f"  Common segments: {len(common_segments)} -> {common_file.name}")
 
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the parse/validate API result options
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from edi_parser import parse_edi, validate_edi
+
+
+TEST_FILE = 'test_files/835/835-denial.dat'
+LENIENT = dict(field_validation_mode='lenient', continue_on_error=True)
+
+
+@pytest.fixture(scope='module')
+def content():
+    with open(TEST_FILE) as f:
+        return f.read()
+
+
+def test_parse_edi_returns_tree_by_default(content):
+    """The default result still carries the parsed tree"""
+    result = parse_edi(content, 'x12', '835005010', **LENIENT)
+
+    assert result['success']
+    assert isinstance(result['data'], dict)
+
+
+def test_parse_edi_without_data(content):
+    """include_data=False skips the tree but keeps the rest of the result"""
+    full = parse_edi(content, 'x12', '835005010', **LENIENT)
+    result = parse_edi(content, 'x12', '835005010', include_data=False, **LENIENT)
+
+    assert result['data'] is None
+    for key in ('success', 'errors', 'message_count'):
+        assert result[key] == full[key]
+
+
+def test_validate_edi_data_matches_parse(content):
+    """include_data=True hands back the same tree parse_edi builds"""
+    parsed = parse_edi(content, 'x12', '835005010', **LENIENT)
+    result = validate_edi(content, 'x12', '835005010',
+                          validation_mode='lenient', include_data=True)
+
+    assert parsed['success']
+    assert result['data'] == parsed['data']
+
+
+def test_validate_edi_omits_data_by_default(content):
+    """Plain validation does not return a tree"""
+    result = validate_edi(content, 'x12', '835005010', validation_mode='lenient')
+
+    assert 'data' not in result
+
+
+def test_validate_edi_data_failure_keeps_errors(content, monkeypatch):
+    """A tree conversion failure leaves data empty and the verdict unchanged"""
+    expected = validate_edi(content, 'x12', '835005010', validation_mode='lenient')
+
+    def fail(node):
+        raise RuntimeError('conversion failed')
+
+    monkeypatch.setattr('edi_parser.api.node_to_dict', fail)
+    result = validate_edi(content, 'x12', '835005010',
+                          validation_mode='lenient', include_data=True)
+
+    assert result['data'] is None
+    for key in ('valid', 'error_count', 'errors', 'summary'):
+        assert result[key] == expected[key]
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test the demo CLI batch runner
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+
+DEMO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'demo.py')
+
+# Log prefixes differ between modes: '--verbose' adds time/logger/function,
+# the edi_parser StreamHandler adds its own timestamped prefix
+_PREFIXES = [
+    re.compile(r'^[\d-]+ [\d:,]+ - edi_parser - [A-Z]+ - '),
+    re.compile(r'^[\d:]+ \[[A-Z]+\] \S+ - '),
+    re.compile(r'^(?:DEBUG|INFO|WARNING|ERROR): '),
+]
+
+
+def _run_demo(*args):
+    """Run demo.py and return its log output without the per-mode prefixes"""
+    proc = subprocess.run(
+        [sys.executable, DEMO, *args],
+        capture_output=True, text=True, timeout=300
+    )
+    lines = []
+    for line in proc.stderr.splitlines():
+        for prefix in _PREFIXES:
+            line = prefix.sub('', line)
+        lines.append(line)
+    return lines
+
+
+def test_parse_all_parallel_matches_serial_order():
+    """Worker logs (including library tracebacks) replay under their own file"""
+    parallel = _run_demo('parse-all', '837', '--lenient')
+    serial = _run_demo('--verbose', 'parse-all', '837', '--lenient')
+
+    assert any('[A60]' in line for line in parallel)
+    assert parallel == serial
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
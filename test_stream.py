@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test the streaming X12 segment reader
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from edi_parser import stream_segments, Delimiters
+
+
+TEST_FILE = 'test_files/835/835-all-fields.dat'
+
+
+def test_delimiters_from_isa():
+    """Separators are read from their fixed ISA positions"""
+    with open(TEST_FILE, 'rb') as f:
+        delimiters = Delimiters.from_isa(f.read(106))
+
+    assert delimiters.element == b'*'
+    assert delimiters.subelement == b':'
+    assert delimiters.segment == b'~'
+    assert delimiters.repetition == b'^'
+
+
+def test_delimiters_reject_non_x12():
+    """A header that is not an ISA segment is refused"""
+    with pytest.raises(ValueError):
+        Delimiters.from_isa(b'UNB+UNOA:1' + b' ' * 100)
+
+
+def test_stream_segments_envelope():
+    """Envelope segments come back in order with positional elements"""
+    segments = [
+        (segment_id, [bytes(e).decode() for e in elements])
+        for segment_id, elements in stream_segments(TEST_FILE)
+    ]
+
+    assert segments[0][0] == 'ISA'
+    assert segments[0][1][6].strip() == 'ABCPAYER'
+    assert segments[1][0] == 'GS'
+    assert segments[2] == ('ST', ['ST', '835', '35681'])
+    assert segments[-1][0] == 'IEA'
+
+
+def test_stream_segments_empty_file(tmp_path):
+    """Empty files are reported as non-X12"""
+    empty = tmp_path / 'empty.dat'
+    empty.write_bytes(b'')
+
+    with pytest.raises(ValueError):
+        list(stream_segments(str(empty)))
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
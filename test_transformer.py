@@ -6,22 +6,21 @@ Test the human-readable name transformer
 import json
 from edi_parser import parse_edi_file_path, add_human_readable_names
 
-def show_segment(data, segment_id, depth=0):
+def show_segment(data, segment_id):
     """Extract and display a specific segment from parsed data"""
-    if isinstance(data, dict):
+    # Depth-first with an explicit stack; children pushed reversed to keep document order
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
         # Handle both BOTSID (original/dual/metadata) and segment_id (replace mode)
-        if data.get('BOTSID') == segment_id or data.get('segment_id') == segment_id:
-            return data
-        if '_children' in data:
-            for child in data['_children']:
-                result = show_segment(child, segment_id, depth + 1)
-                if result:
-                    return result
-        if 'children' in data and isinstance(data['children'], list):
-            for child in data['children']:
-                result = show_segment(child, segment_id, depth + 1)
-                if result:
-                    return result
+        if node.get('BOTSID') == segment_id or node.get('segment_id') == segment_id:
+            return node
+        if isinstance(node.get('children'), list):
+            stack.extend(reversed(node['children']))
+        if '_children' in node:
+            stack.extend(reversed(node['_children']))
     return None
 
 def main():
@@ -51,22 +50,23 @@ def main():
     if bpr_dual:
         print(json.dumps(bpr_dual, indent=2))
 
+    # The transformer works per node and never mutates its input, so the other
+    # modes only need to transform the BPR segment found above, not the whole tree
+
     # Transform with replace mode
     print("\n" + "=" * 80)
     print("MODE 2: REPLACE - Replace technical codes with readable names")
     print("=" * 80)
-    transformed_replace = add_human_readable_names(result['data'], '835', '5010', 'replace')
-    bpr_replace = show_segment(transformed_replace, 'BPR')
-    if bpr_replace:
+    if bpr_original:
+        bpr_replace = add_human_readable_names(bpr_original, '835', '5010', 'replace')
         print(json.dumps(bpr_replace, indent=2))
 
     # Transform with metadata mode
     print("\n" + "=" * 80)
     print("MODE 3: METADATA - Add full metadata including descriptions")
     print("=" * 80)
-    transformed_metadata = add_human_readable_names(result['data'], '835', '5010', 'metadata')
-    bpr_metadata = show_segment(transformed_metadata, 'BPR')
-    if bpr_metadata:
+    if bpr_original:
+        bpr_metadata = add_human_readable_names(bpr_original, '835', '5010', 'metadata')
         print(json.dumps(bpr_metadata, indent=2))
 
     # Test with 837 file